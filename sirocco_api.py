@@ -2,13 +2,26 @@
 # The functions are used to obtain information about the available timezones, the user's projects, forecasts, backtests, and more.
 # The functions are used in the Jupyter Notebook 'Sirocco Energy API - Example Usage.ipynb' to demonstrate how to use the API.
 
+import asyncio
+import copy
+import functools
+import hashlib
+import inspect
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pprint import pprint
-from typing import Any, Dict, Union
+from typing import Any, Dict, Iterable, List, Union
 
-import pandas as pd
+import aiohttp
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession, create_key
+from urllib3.exceptions import InvalidHeader
+from urllib3.util.retry import RequestHistory, Retry
 
 API_TOKEN = (
     os.environ.get("SIROCCO_API")
@@ -18,6 +31,324 @@ API_TOKEN = (
 
 API_VERSION = "v1.1"
 
+# Client-side pacing so bulk loops stay under the server quota instead of
+# triggering 429s and waiting out the retry backoff. Change it with
+# `set_rate_limit()`; reassigning the constant after import has no effect.
+RATE_LIMIT_PER_MINUTE = 120
+
+# Endpoint URLs, built once at import time.
+_BASE = f"https://api.sirocco.energy/national/{{endpoint}}/{API_VERSION}/"
+_URL_TIMEZONES = _BASE.format(endpoint="timezones")
+_URL_RUNS = _BASE.format(endpoint="runs")
+_URL_PROJECTS = _BASE.format(endpoint="projects")
+_URL_FORECAST = _BASE.format(endpoint="forecast")
+_URL_SELECTED_FORECAST = _BASE.format(endpoint="selectedforecast")
+_URL_BACKTESTS = _BASE.format(endpoint="backtests")
+_URL_SELECTED_BACKTESTS = _BASE.format(endpoint="selectedbacktests")
+_URL_REAL_DATA = _BASE.format(endpoint="realdata")
+
+
+class _TokenBucket:
+    """Token-bucket rate limiter shared by the sync and async request paths.
+
+    Each request takes one token; tokens refill at `rate_per_sec` up to
+    `capacity`. When the bucket is empty the caller waits just long enough
+    for its token, so concurrent callers are spaced out evenly.
+    """
+
+    def __init__(self, rate_per_sec: float, capacity: int):
+        self.rate = rate_per_sec
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Takes a token and returns how many seconds to wait before using it."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.last) * self.rate
+            )
+            self.last = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def acquire(self) -> None:
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+def _make_bucket(per_minute: int) -> _TokenBucket:
+    """Token bucket for `per_minute` requests, allowing bursts of 10 seconds' worth."""
+    return _TokenBucket(per_minute / 60, capacity=max(1, per_minute // 6))
+
+
+_BUCKET = _make_bucket(RATE_LIMIT_PER_MINUTE)
+
+
+def set_rate_limit(per_minute: int) -> None:
+    """Sets how many requests per minute are sent to the API.
+
+    Args:
+        per_minute (int): Maximum requests per minute, e.g. your account's quota.
+
+    Raises:
+        ValueError: If per_minute is not a positive integer.
+    """
+    global RATE_LIMIT_PER_MINUTE, _BUCKET
+    if not isinstance(per_minute, int) or per_minute <= 0:
+        raise ValueError("Error: per_minute must be a positive integer")
+    RATE_LIMIT_PER_MINUTE = per_minute
+    _BUCKET = _make_bucket(per_minute)
+
+# Transient failures (rate limiting and 5xx) are retried with exponential backoff,
+# honouring the server's Retry-After header when it sends one. Random jitter is
+# added to each wait so clients that failed together don't retry in lockstep.
+_RETRY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    backoff_jitter=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    respect_retry_after_header=True,
+    allowed_methods=["GET"],
+    raise_on_status=False,
+)
+
+
+def _cache_key(request, **kwargs) -> str:
+    """Cache key for the HTTP cache, scoped to the token that made the request.
+
+    requests-cache redacts the Authorization header before building its own key,
+    so a hash of the token is appended here instead. The token itself is never
+    written to the cache file.
+    """
+    token = request.headers.get("Authorization") or ""
+    digest = hashlib.sha256(token.encode()).hexdigest()[:16]
+    return f"{create_key(request, **kwargs)}-{digest}"
+
+
+class _RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that takes a token from `_BUCKET` before each request it sends.
+
+    The adapter sits below the HTTP cache, so cache hits never consume tokens
+    or wait; only requests that actually reach the server are paced. Retries
+    made by urllib3 happen inside `send` and are paced by `_RETRY`'s backoff
+    and the server's Retry-After header instead of the bucket.
+    """
+
+    def send(self, request, **kwargs):
+        _BUCKET.acquire()
+        return super().send(request, **kwargs)
+
+
+def _build_session(cache_name: str = "sirocco_api", **cache_kwargs) -> CachedSession:
+    """Builds the cached, retrying session used by every API call.
+
+    By default responses are stored in `sirocco_api.sqlite` under the user cache
+    directory (e.g. `~/.cache` on Linux); `cache_kwargs` override the backend.
+    """
+    cache_kwargs.setdefault("backend", "sqlite")
+    cache_kwargs.setdefault("use_cache_dir", cache_kwargs["backend"] == "sqlite")
+    session = CachedSession(
+        cache_name,
+        expire_after=300,
+        cache_control=True,
+        allowable_codes=(200,),
+        allowable_methods=("GET",),
+        key_fn=_cache_key,
+        **cache_kwargs,
+    )
+    session.mount(
+        "https://",
+        _RateLimitedAdapter(
+            pool_connections=4, pool_maxsize=20, max_retries=_RETRY
+        ),
+    )
+    return session
+
+
+# Shared session so every call reuses the same pooled (keep-alive) connections
+# instead of paying a new TCP + TLS handshake per request. Responses are also
+# cached on disk: fresh entries are served locally, and stale ones are
+# revalidated with ETag/Last-Modified so unchanged data comes back as a 304.
+# Expired entries are purged at import so large backtest payloads don't pile up.
+_SESSION = _build_session()
+_SESSION.cache.delete(expired=True)
+
+
+class SiroccoAPIError(Exception):
+    """Raised when the Sirocco API answers with an unsuccessful status code.
+
+    Attributes:
+        status (int): HTTP status code of the response.
+        text (str): Body of the response.
+    """
+
+    def __init__(self, status: int, text: str):
+        super().__init__(
+            f"Error: Received response with status code {status}: {text}"
+        )
+        self.status = status
+        self.text = text
+
+
+def _raise_for_status(response: requests.Response) -> None:
+    """Raises `SiroccoAPIError` if the response is not successful."""
+    if not response.ok:
+        raise SiroccoAPIError(response.status_code, response.text)
+
+
+def _json(response: requests.Response) -> Any:
+    """Decodes a JSON response body with orjson, straight from the raw bytes."""
+    return orjson.loads(response.content)
+
+
+def _get(url: str, **kwargs) -> requests.Response:
+    """Sends a GET through the shared (cached, rate-limited) session.
+
+    The Authorization header is read from `API_TOKEN` on every call, so
+    reassigning `sirocco_api.API_TOKEN` after import takes effect immediately.
+    """
+    return _SESSION.get(url, headers={"Authorization": API_TOKEN}, **kwargs)
+
+
+def close_session() -> None:
+    """Closes the shared HTTP session and releases its pooled connections."""
+    _SESSION.close()
+
+
+def _ttl_cache(ttl: float):
+    """Memoizes a function's successful results for `ttl` seconds.
+
+    The cache is keyed by the bound call arguments (so positional, keyword and
+    default spellings of the same call share an entry) and the current API token,
+    so switching tokens never returns another user's data. Exceptions are not
+    cached, and calls whose arguments can't be hashed bypass the cache so the
+    function's own validation errors surface. Each call gets its own deep copy,
+    so callers may mutate the result. Unlike the HTTP cache, hits skip the
+    sqlite lookup and the TTL can be longer than the HTTP cache's 5 minute expiry.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+        cache: Dict[Any, Any] = {}
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                key = (tuple(bound.arguments.items()), API_TOKEN)
+                hash(key)
+            except TypeError:
+                # Unhashable or mismatched arguments: let the function itself
+                # validate them and raise its own error, without caching.
+                return func(*args, **kwargs)
+            now = time.monotonic()
+            with lock:
+                hit = cache.get(key)
+            if hit is not None and now - hit[0] < ttl:
+                return copy.deepcopy(hit[1])
+            value = func(*args, **kwargs)
+            with lock:
+                cache[key] = (now, copy.deepcopy(value))
+            return value
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
+def _validate_run(value: Union[int, str], name: str) -> Union[int, str]:
+    """Checks that a run ID is an integer or a string that can be converted to one."""
+    try:
+        int(value)
+    except (TypeError, ValueError):
+        raise ValueError(
+            f"Error: {name} must be an integer or a string that can be converted to an integer"
+        )
+    return value
+
+
+def _validate_dt(value: Union[str, datetime], name: str) -> str:
+    """Checks a date argument and returns it as a query string.
+
+    `datetime` objects (including `pd.Timestamp`) are formatted as
+    'YYYY-MM-DD HH:MM:SS'; strings must already be in that format (or 'YYYY-MM-DD').
+    """
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(value, str):
+        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d"):
+            try:
+                datetime.strptime(value, fmt)
+                return value
+            except ValueError:
+                continue
+    raise ValueError(f"Error: {name} must be in the format YYYY-MM-DD HH:MM:SS")
+
+
+def _validate_pos_int(value: Union[int, str], name: str) -> int:
+    """Checks that an argument is a positive integer and returns it as an int."""
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Error: {name} must be a positive integer")
+    if value < 0:
+        raise ValueError(f"Error: {name} must be a positive integer")
+    return value
+
+
+def _endpoint(url: str, **specs):
+    """Turns a function signature into a GET client for one API endpoint.
+
+    `specs` maps each argument of the decorated function to a
+    `(query_name, validator)` pair; a `None` validator sends the value as is.
+    Optional arguments left as `None` are not sent, while explicit values such
+    as `init_ahead=0` are validated and sent.
+
+    The decorated function only declares the signature and docstring. Its body
+    is a pre-request hook that receives the validated values and may raise for
+    cross-argument rules; it returns nothing. The generated client returns the
+    decoded JSON, so it is annotated `-> Dict` here rather than on the stub.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            params = {}
+            for name, value in bound.arguments.items():
+                if value is None:
+                    continue
+                query_name, validate = specs[name]
+                if validate is not None:
+                    value = validate(value, name)
+                bound.arguments[name] = params[query_name] = value
+            func(*bound.args, **bound.kwargs)
+
+            response = _get(url, params=params)
+            _raise_for_status(response)
+            return _json(response)
+
+        wrapper.__annotations__ = {**func.__annotations__, "return": Dict}
+        wrapper.__signature__ = signature.replace(return_annotation=Dict)
+        return wrapper
+
+    return decorator
+
 
 def display_json_pretty(json_data):
     """Displays JSON data in a more readable format without converting it to a string."""
@@ -30,72 +361,58 @@ def get_current_utc_datetime() -> str:
     return utc_datetime
 
 
-def get_available_timezones() -> Dict:
-    """Function to get available timezones from the API"""
-    url = f"https://api.sirocco.energy/national/timezones/{API_VERSION}/"
-    try:
-        response = requests.get(url)
-        # Verifying the response status code:
-        if response.status_code == 200:
-            return response.json()  # Returning the JSON response if successful
-        else:
-            return f"Error: Received response with status code {response.status_code}"
-    except Exception as e:
-        return f"Error: An exception occurred - {str(e)}"  # Handling unexpected errors
+@_ttl_cache(ttl=3600)
+@_endpoint(_URL_TIMEZONES)
+def get_available_timezones():
+    """Function to get available timezones from the API.
 
+    Results are cached for an hour, as the list rarely changes.
 
-def get_all_projects() -> Dict:
+    Raises:
+        SiroccoAPIError: If the API returns an error.
     """
-    Fetch all available projects from the Sirocco API.
 
-    Args:
-        auth_token (str): The authorization token to access the API.
+
+@_endpoint(_URL_RUNS)
+def get_all_projects():
+    """
+    Fetch all available projects from the Sirocco API.
 
     Returns:
         list: A list of dictionaries containing project information.
 
     Raises:
-        Exception: Raises an exception if the API call fails or returns an error.
+        SiroccoAPIError: If the API returns an error.
     """
-    url = f"https://api.sirocco.energy/national/runs/{API_VERSION}/"
-    headers = {"Authorization": API_TOKEN}
-
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()  # Raises an HTTPError for bad responses (4XX, 5XX)
-        projects = (
-            response.json()
-        )  # Assuming the response is JSON and has the desired data directly
-        return projects  # Adjust this if the data structure is nested differently
-    except requests.exceptions.RequestException as e:
-        # Handle specific exceptions or general network related exceptions
-        raise Exception(f"Failed to fetch projects due to: {str(e)}")
 
 
+@_ttl_cache(ttl=300)
 def get_my_projects(return_id_project: bool = False) -> Dict:
-    """Function to get projects associated with the user's personal token."""
+    """Function to get projects associated with the user's personal token.
+
+    Results are cached for 5 minutes per token and `return_id_project` value.
+
+    Raises:
+        SiroccoAPIError: If the API returns an error.
+    """
     # validate return_id_project is a boolean
     if not isinstance(return_id_project, bool):
         raise ValueError("Error: return_id_project must be a boolean")
-    url = f"https://api.sirocco.energy/national/projects/{API_VERSION}/"
-    headers = {"Authorization": API_TOKEN}
 
-    try:
-        response = requests.get(url, headers=headers)
-        if response.status_code == 200:
-            if return_id_project and response.json()["control"] == "Success":
-                my_projects = response.json()
-                return {p["id"]: p["name"] for p in my_projects["runs"]}
-            return response.json()
-        else:
-            raise Exception(
-                f"Error: Received response with status code {response.status_code}"
-            )
-    except Exception as e:
-        raise Exception(f"Error: An exception occurred - {str(e)}")
+    response = _get(_URL_PROJECTS)
+    _raise_for_status(response)
+    my_projects = _json(response)
+    if return_id_project and my_projects["control"] == "Success":
+        return {p["id"]: p["name"] for p in my_projects["runs"]}
+    return my_projects
 
 
-def get_forecasts_info(run, timezone="UTC") -> Dict:
+@_endpoint(
+    _URL_FORECAST,
+    run=("run", _validate_run),
+    timezone=("timezone", None),
+)
+def get_forecasts_info(run: Union[int, str], timezone: str = "UTC"):
     """Function to get the forecast data for an energy farm.
 
     Args:
@@ -103,141 +420,167 @@ def get_forecasts_info(run, timezone="UTC") -> Dict:
         timezone (str): Timezone in which the information will be displayed. Defaults to 'UTC'.
 
     Returns:
-        str or dict: Forecast data or error message.
+        dict: Forecast data.
+
+    Raises:
+        SiroccoAPIError: If the API returns an error.
     """
-    url = f"https://api.sirocco.energy/national/forecast/{API_VERSION}/?run={run}&timezone={timezone}"
-    headers = {
-        "Authorization": API_TOKEN
-    }  # Ensure API_TOKEN is defined and secured elsewhere
 
-    try:
-        response = requests.get(url, headers=headers)
-        if response.status_code == 200:
-            return response.json()  # Returning the JSON response if successful
-        else:
-            raise Exception(
-                f"Error: Received response with status code {response.status_code}"
-            )
-    except Exception as e:
-        raise Exception(f"Error: An exception occurred - {str(e)}")
 
+def _retry_delay(attempt: int, retry_after: str = None) -> float:
+    """Seconds to wait before retry number `attempt` (0-based) on the async path.
+
+    Uses the server's Retry-After header when present. Otherwise the delay comes
+    from `_RETRY.get_backoff_time()` after `attempt + 1` failures, so the async
+    path follows urllib3's schedule, cap and jitter exactly.
+    """
+    if retry_after is not None:
+        try:
+            return _RETRY.parse_retry_after(retry_after)
+        except InvalidHeader:
+            pass
+    failure = RequestHistory("GET", None, None, None, None)
+    return _RETRY.new(history=(failure,) * (attempt + 1)).get_backoff_time()
+
+
+async def get_forecasts_info_many_async(
+    runs: Iterable[Union[int, str]], timezone: str = "UTC"
+) -> List[Dict]:
+    """Async version of `get_forecasts_info` that fetches several projects concurrently.
+
+    Args:
+        runs (iterable): IDs for your projects.
+        timezone (str): Timezone in which the information will be displayed. Defaults to 'UTC'.
+
+    Returns:
+        list: Forecast data for each run, in the same order as `runs`.
+
+    Raises:
+        SiroccoAPIError: If the API returns an error.
 
+    Responses with a status in `_RETRY.status_forcelist` are retried up to
+    `_RETRY.total` times with the same backoff schedule as the sync path
+    (see `_retry_delay`), honouring Retry-After. Connection errors are not retried.
+    """
+
+    async def fetch(session: aiohttp.ClientSession, run) -> Dict:
+        await _BUCKET.acquire_async()
+        for attempt in range(_RETRY.total + 1):
+            async with session.get(
+                _URL_FORECAST,
+                params={"run": str(run), "timezone": timezone},
+            ) as response:
+                if response.ok:
+                    return orjson.loads(await response.read())
+                if (
+                    response.status not in _RETRY.status_forcelist
+                    or attempt == _RETRY.total
+                ):
+                    raise SiroccoAPIError(response.status, await response.text())
+                delay = _retry_delay(attempt, response.headers.get("Retry-After"))
+            await asyncio.sleep(delay)
+
+    runs = [_validate_run(run, "run") for run in runs]
+    async with aiohttp.ClientSession(
+        headers={"Authorization": API_TOKEN},
+        connector=aiohttp.TCPConnector(limit=20),
+    ) as session:
+        return await asyncio.gather(*[fetch(session, run) for run in runs])
+
+
+def get_forecasts_info_many(
+    runs: Iterable[Union[int, str]], timezone: str = "UTC"
+) -> List[Dict]:
+    """Function to get the forecast data for several energy farms concurrently.
+
+    Args:
+        runs (iterable): IDs for your projects.
+        timezone (str): Timezone in which the information will be displayed. Defaults to 'UTC'.
+
+    Returns:
+        list: Forecast data for each run, in the same order as `runs`.
+
+    Raises:
+        SiroccoAPIError: If the API returns an error.
+    """
+    coro = get_forecasts_info_many_async(runs, timezone=timezone)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    # An event loop is already running (e.g. inside Jupyter), so asyncio.run
+    # cannot be used from this thread; run the coroutine on a worker thread.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+@_endpoint(
+    _URL_SELECTED_FORECAST,
+    run=("run", _validate_run),
+    timezone=("timezone", None),
+    init_date=("init", _validate_dt),
+    end_date=("end", _validate_dt),
+)
 def get_selected_forecast(
     run: Union[int, str],
     timezone: str = "UTC",
     init_date: str = None,
     end_date: str = None,
-) -> Dict:
+):
     """Function to get the latest complete forecast for a specified time interval.
 
     Args:
         run (str): ID for your project.
         timezone (str): Timezone in which the information will be displayed. Defaults to 'UTC'.
-        init_date (str): Optional. Beginning of the predictions [YYYY/MM/DD HH:mm:ss].
-        end_date (str): Optional. End of the predictions [YYYY/MM/DD HH:mm:ss].
+        init_date (str): Optional. Beginning of the predictions [YYYY-MM-DD HH:mm:ss].
+        end_date (str): Optional. End of the predictions [YYYY-MM-DD HH:mm:ss].
 
     Returns:
-        str or dict: Selected forecast data or error message.
-    """
-    # Check run is an integer or can be converted to an integer
-    try:
-        int(run)
-    except ValueError:
-        raise ValueError(
-            "Error: run must be an integer or a string that can be converted to an integer"
-        )
-
-    # Constructing the API request URL with optional query parameters
-    url = f"https://api.sirocco.energy/national/selectedforecast/{API_VERSION}/?run={run}&timezone={timezone}"
-    if init_date:
-        try:
-            pd.to_datetime(end_date, format="%Y-%m-%d %H:%M:%S")
-        except ValueError:
-            raise ValueError(
-                "Error: init_date must be in the format YYYY-mm-dd HH:MM:SS"
-            )
-        url += f"&init={init_date}"
-    if end_date:
-        try:
-            pd.to_datetime(end_date, format="%Y-%m-%d %H:%M:%S")
-        except ValueError:
-            raise ValueError(
-                "Error: end_date must be in the format YYYY-mm-dd HH:MM:SS"
-            )
-        url += f"&end={end_date}"
+        dict: Selected forecast data.
 
-    headers = {
-        "Authorization": API_TOKEN
-    }  # API_TOKEN must be defined and secured elsewhere
-
-    try:
-        response = requests.get(url, headers=headers)
-        if response.status_code == 200:
-            return response.json()  # Successful request returns JSON data
-        else:
-            raise Exception(
-                f"Error: Received response with status code {response.status_code}"
-            )
-    except Exception as e:
-        raise Exception(f"Error: An exception occurred - {str(e)}")
+    Raises:
+        SiroccoAPIError: If the API returns an error.
+    """
 
 
+@_endpoint(
+    _URL_BACKTESTS,
+    run=("run", _validate_run),
+    timezone=("timezone", None),
+    init_date=("init", _validate_dt),
+    end_date=("end", _validate_dt),
+)
 def get_backtests_info(
     run: Union[int, str],
     timezone: str = "UTC",
     init_date: str = None,
     end_date: str = None,
-) -> Dict:
+):
     """Function to obtain basic information for each forecast generated during the last 6 months.
 
     Args:
         run (str): ID for your project.
-        init_date (str): Optional. Starting date of the forecast [YYYY/MM/DD HH:mm:ss].
-        end_date (str): Optional. Ending date of the forecast [YYYY/MM/DD HH:mm:ss].
+        init_date (str): Optional. Starting date of the forecast [YYYY-MM-DD HH:mm:ss].
+        end_date (str): Optional. Ending date of the forecast [YYYY-MM-DD HH:mm:ss].
         timezone (str): Timezone in which the information will be displayed. Defaults to 'UTC'.
 
     Returns:
-        str or dict: Backtests data or error message.
-    """
-    try:
-        int(run)
-    except ValueError:
-        raise ValueError(
-            "Error: run must be an integer or a string that can be converted to an integer"
-        )
-    # Formatting the URL with the necessary query parameters
-    url = f"https://api.sirocco.energy/national/backtests/{API_VERSION}/?run={run}&timezone={timezone}"
-    if init_date:
-        try:
-            pd.to_datetime(end_date, format="%Y-%m-%d %H:%M:%S")
-        except ValueError:
-            raise ValueError(
-                "Error: init_date must be in the format YYYY-mm-dd HH:MM:SS"
-            )
-        url += f"&init={init_date}"
-    if end_date:
-        try:
-            pd.to_datetime(end_date, format="%Y-%m-%d %H:%M:%S")
-        except ValueError:
-            raise ValueError(
-                "Error: end_date must be in the format YYYY-mm-dd HH:MM:SS"
-            )
-        url += f"&end={end_date}"
+        dict: Backtests data.
 
-    headers = {"Authorization": API_TOKEN}  # Ensure API_TOKEN is defined securely
-
-    try:
-        response = requests.get(url, headers=headers)
-        if response.status_code == 200:
-            return response.json()  # Returning JSON data if successful
-        else:
-            raise Exception(
-                f"Error: Received response with status code {response.status_code}"
-            )
-    except Exception as e:
-        raise Exception(f"Error: An exception occurred - {str(e)}")
+    Raises:
+        SiroccoAPIError: If the API returns an error.
+    """
 
 
+@_endpoint(
+    _URL_SELECTED_BACKTESTS,
+    run=("run", _validate_run),
+    init_date=("init", _validate_dt),
+    end_date=("end", _validate_dt),
+    init_ahead=("init_ahead", _validate_pos_int),
+    end_ahead=("end_ahead", _validate_pos_int),
+    timezone=("timezone", None),
+)
 def get_selected_backtests(
     run: Union[int, str],
     init_date: str = None,
@@ -245,7 +588,7 @@ def get_selected_backtests(
     init_ahead: int = None,
     end_ahead: int = None,
     timezone: str = "UTC",
-) -> Dict:
+):
     """Function to obtain each forecast generated during the last 6 months.
 
     Args:
@@ -257,77 +600,29 @@ def get_selected_backtests(
         timezone (str): Timezone in which the information will be displayed. Defaults to 'UTC'.
 
     Returns:
-        str or dict: Selected backtests data or error message.
-    """
-    try:
-        int(run)
-    except ValueError:
-        raise ValueError(
-            "Error: run must be an integer or a string that can be converted to an integer"
-        )
-    # Constructing the API request URL with necessary query parameters
-    url = f"https://api.sirocco.energy/national/selectedbacktests/{API_VERSION}/?run={run}&timezone={timezone}"
-    if init_date:
-        try:
-            pd.to_datetime(init_date, format="%Y-%m-%d %H:%M:%S")
-        except ValueError:
-            raise ValueError(
-                "Error: init_date must be in the format YYYY-mm-dd HH:MM:SS"
-            )
-        url += f"&init={init_date}"
-    if end_date:
-        try:
-            pd.to_datetime(end_date, format="%Y-%m-%d %H:%M:%S")
-        except ValueError:
-            raise ValueError(
-                "Error: end_date must be in the format YYYY-mm-dd HH:MM:SS"
-            )
-        url += f"&end={end_date}"
-    if init_ahead:
-        try:
-            init_ahead = int(init_ahead)
-            # Ensuring init_ahead is a positive integer
-            if init_ahead < 0:
-                raise ValueError("Error: init_ahead must be a positive integer")
-        except ValueError:
-            raise ValueError("Error: init_ahead must be a positive integer")
-        url += f"&init_ahead={init_ahead}"
-    if end_ahead:
-        try:
-            end_ahead = int(end_ahead)
-            # Ensuring end_ahead is a positive integer
-            if end_ahead < 0:
-                raise ValueError("Error: end_ahead must be a positive integer")
-        except ValueError:
-            raise ValueError("Error: end_ahead must be a positive integer")
-        url += f"&end_ahead={end_ahead}"
+        dict: Selected backtests data.
 
+    Raises:
+        SiroccoAPIError: If the API returns an error.
+    """
     # check end_ahead is always greater than init_ahead, raise an error if not
-    if end_ahead and init_ahead and end_ahead <= init_ahead:
+    if end_ahead is not None and init_ahead is not None and end_ahead <= init_ahead:
         raise ValueError("Error: end_ahead must be greater than init_ahead")
 
-    headers = {
-        "Authorization": API_TOKEN
-    }  # API_TOKEN should be defined and secured elsewhere
-
-    try:
-        response = requests.get(url, headers=headers)
-        if response.status_code == 200:
-            return response.json()  # Returning JSON data if successful
-        else:
-            raise Exception(
-                f"Error: Received response with status code {response.status_code}"
-            )
-    except Exception as e:
-        raise Exception(f"Error: An exception occurred - {str(e)}")
-
 
+@_endpoint(
+    _URL_REAL_DATA,
+    run_id=("run", _validate_run),
+    init_date=("init", _validate_dt),
+    end_date=("end", _validate_dt),
+    timezone=("timezone", None),
+)
 def get_real_data(
     run_id: Union[int, str],
     init_date: str = None,
     end_date: str = None,
     timezone: str = "UTC",
-) -> Dict:
+):
     """
     Fetch hour by hour real energy production for a selected project.
 
@@ -342,52 +637,6 @@ def get_real_data(
 
     Raises:
         ValueError: If the run_id, init_date, or end_date cannot be processed.
-        Exception: If the API call fails or returns an error.
+        SiroccoAPIError: If the API returns an error.
     """
-    # Check run is an integer or can be converted to an integer
-    try:
-        int(run_id)
-    except ValueError:
-        raise ValueError(
-            "Error: run must be an integer or a string that can be converted to an integer"
-        )
-
-    # Constructing the API request URL with optional query parameters
-    url = f"https://api.sirocco.energy/national/realdata/{API_VERSION}/?run={run_id}&timezone={timezone}"
-    if init_date:
-        try:
-            pd.to_datetime(init_date, format="%Y-%m-%d %H:%M:%S")
-        except ValueError:
-            raise ValueError(
-                "Error: init_date must be in the format YYYY-MM-DD HH:MM:SS"
-            )
-        url += f"&init={init_date}"
-
-    if end_date:
-        try:
-            pd.to_datetime(end_date, format="%Y-%m-%d %H:%M:%S")
-        except ValueError:
-            raise ValueError(
-                "Error: end_date must be in the format YYYY-MM-DD HH:MM:SS"
-            )
-        url += f"&end={end_date}"
-
-    headers = {
-        "Authorization": API_TOKEN
-    }  # API_TOKEN must be defined and secured elsewhere
-
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()  # Raises an HTTPError for bad responses (4XX, 5XX)
-        if response.status_code == 200:
-            return response.json()  # Successful request returns JSON data
-        else:
-            raise Exception(
-                f"Error: Received response with status code {response.status_code}"
-            )
-    except requests.exceptions.RequestException as e:
-        # Handle specific exceptions or general network related exceptions
-        raise Exception(f"Failed to fetch real data due to: {str(e)}")
-    except Exception as e:
-        raise Exception(f"Error: An exception occurred - {str(e)}")
 
@@ -0,0 +1,116 @@
+import io
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+import orjson
+import pytest
+from requests.adapters import HTTPAdapter
+from urllib3.response import HTTPResponse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sirocco_api  # noqa: E402
+
+
+class FakeTransport:
+    """Stands in for `HTTPAdapter.send`, recording requests instead of hitting the API.
+
+    Each response echoes the request path, query parameters and token as JSON,
+    unless a status code is queued in `statuses`.
+    """
+
+    def __init__(self):
+        self.sent = []
+        self.statuses = []
+
+    def send(self, adapter, request, **kwargs):
+        self.sent.append(request)
+        url = urlsplit(request.url)
+        body = orjson.dumps(
+            {
+                "path": url.path,
+                "params": dict(parse_qsl(url.query)),
+                "token": request.headers.get("Authorization"),
+            }
+        )
+        status = self.statuses.pop(0) if self.statuses else 200
+        raw = HTTPResponse(
+            body=io.BytesIO(body),
+            status=status,
+            headers={"Content-Type": "application/json"},
+            preload_content=False,
+        )
+        return adapter.build_response(request, raw)
+
+
+class CountingBucket(sirocco_api._TokenBucket):
+    """Token bucket that never waits but counts how many tokens were taken."""
+
+    def __init__(self):
+        super().__init__(rate_per_sec=1000, capacity=1000)
+        self.taken = 0
+
+    def _reserve(self) -> float:
+        self.taken += 1
+        return 0.0
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    """Routes the module's shared session, rate limiter included, to a `FakeTransport`.
+
+    The session is built by `_build_session` on an in-memory cache, so only the
+    network transport below `_RateLimitedAdapter` is replaced.
+    """
+    transport = FakeTransport()
+    monkeypatch.setattr(
+        HTTPAdapter,
+        "send",
+        lambda adapter, request, **kwargs: transport.send(adapter, request, **kwargs),
+    )
+    monkeypatch.setattr(
+        sirocco_api, "_SESSION", sirocco_api._build_session(backend="memory")
+    )
+    monkeypatch.setattr(sirocco_api, "API_TOKEN", "token-a")
+    transport.bucket = CountingBucket()
+    monkeypatch.setattr(sirocco_api, "_BUCKET", transport.bucket)
+    sirocco_api.get_available_timezones.cache_clear()
+    sirocco_api.get_my_projects.cache_clear()
+    return transport
+
+
+@pytest.fixture
+def local_server():
+    """Serves queued HTTP status codes from a local server, one per request.
+
+    Yields `(url, statuses, seen)`: append codes to `statuses` before calling;
+    every request path is recorded in `seen`. An empty queue answers 200.
+    """
+    statuses = []
+    seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            seen.append(self.path)
+            status = statuses.pop(0) if statuses else 200
+            body = orjson.dumps({"status": status})
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/", statuses, seen
+    finally:
+        server.shutdown()
+        server.server_close()
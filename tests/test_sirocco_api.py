@@ -0,0 +1,339 @@
+import asyncio
+import inspect
+from datetime import datetime
+
+import pytest
+from aiohttp import web
+
+import sirocco_api
+
+
+def test_http_cache_is_scoped_per_token(fake_api):
+    session = sirocco_api._SESSION
+    url = sirocco_api._URL_PROJECTS
+
+    first = session.get(url, headers={"Authorization": "token-a"})
+    other = session.get(url, headers={"Authorization": "token-b"})
+    again = session.get(url, headers={"Authorization": "token-a"})
+
+    assert len(fake_api.sent) == 2
+    assert first.json()["token"] == "token-a"
+    assert other.json()["token"] == "token-b"
+    assert again.from_cache and again.json()["token"] == "token-a"
+
+
+def test_http_cache_does_not_store_the_token(fake_api):
+    sirocco_api._SESSION.get(
+        sirocco_api._URL_PROJECTS, headers={"Authorization": "token-a"}
+    )
+
+    cached = list(sirocco_api._SESSION.cache.responses.values())
+    assert cached
+    assert all(
+        r.request.headers.get("Authorization") != "token-a" for r in cached
+    )
+
+
+def test_token_is_read_on_every_call(fake_api, monkeypatch):
+    assert sirocco_api.get_all_projects()["token"] == "token-a"
+
+    monkeypatch.setattr(sirocco_api, "API_TOKEN", "token-b")
+    assert sirocco_api.get_all_projects()["token"] == "token-b"
+    assert len(fake_api.sent) == 2
+
+
+def test_forecasts_many_retries_transient_errors(monkeypatch):
+    statuses = {"1": [503, 200], "2": [200]}
+    seen = []
+
+    async def handler(request):
+        run = request.query["run"]
+        seen.append(run)
+        status = statuses[run].pop(0)
+        return web.json_response(
+            {"run": run}, status=status, headers={"Retry-After": "0"}
+        )
+
+    async def scenario():
+        app = web.Application()
+        app.router.add_get("/forecast/", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        monkeypatch.setattr(
+            sirocco_api, "_URL_FORECAST", f"http://127.0.0.1:{port}/forecast/"
+        )
+        try:
+            return await sirocco_api.get_forecasts_info_many_async([1, 2])
+        finally:
+            await runner.cleanup()
+
+    monkeypatch.setattr(sirocco_api, "_BUCKET", sirocco_api._TokenBucket(1000, 1000))
+    assert asyncio.run(scenario()) == [{"run": "1"}, {"run": "2"}]
+    assert sorted(seen) == ["1", "1", "2"]
+
+
+def test_retry_delay_prefers_retry_after():
+    assert sirocco_api._retry_delay(0, "3") == 3
+
+
+def test_retry_delay_matches_urllib3_schedule(monkeypatch):
+    monkeypatch.setattr(
+        sirocco_api, "_RETRY", sirocco_api._RETRY.new(backoff_jitter=0)
+    )
+
+    delays = [sirocco_api._retry_delay(attempt) for attempt in range(5)]
+
+    # urllib3 waits nothing before the first retry, then factor * 2 ** (n - 1).
+    assert delays == [0, 1.0, 2.0, 4.0, 8.0]
+    assert sirocco_api._retry_delay(1, "not a date") == 1.0
+    assert sirocco_api._retry_delay(20) == sirocco_api._RETRY.backoff_max
+
+
+def test_retry_delay_adds_jitter():
+    jitter = sirocco_api._RETRY.backoff_jitter
+
+    delays = [sirocco_api._retry_delay(2) for _ in range(20)]
+
+    assert all(2.0 <= delay <= 2.0 + jitter for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_ttl_cache_normalises_arguments():
+    calls = []
+
+    @sirocco_api._ttl_cache(ttl=60)
+    def fetch(flag: bool = False):
+        calls.append(flag)
+        return {"flag": flag}
+
+    fetch()
+    fetch(False)
+    fetch(flag=False)
+    fetch(True)
+    assert calls == [False, True]
+
+
+def test_ttl_cache_is_keyed_by_token_and_returns_copies(monkeypatch):
+    calls = []
+
+    @sirocco_api._ttl_cache(ttl=60)
+    def fetch():
+        calls.append(sirocco_api.API_TOKEN)
+        return {"items": [1]}
+
+    monkeypatch.setattr(sirocco_api, "API_TOKEN", "token-a")
+    fetch()["items"].append(2)
+    assert fetch() == {"items": [1]}
+
+    monkeypatch.setattr(sirocco_api, "API_TOKEN", "token-b")
+    fetch()
+    assert calls == ["token-a", "token-b"]
+
+
+def test_ttl_cache_expires(monkeypatch):
+    calls = []
+    clock = [100.0]
+    monkeypatch.setattr(sirocco_api.time, "monotonic", lambda: clock[0])
+
+    @sirocco_api._ttl_cache(ttl=10)
+    def fetch():
+        calls.append(clock[0])
+        return {}
+
+    fetch()
+    clock[0] += 5
+    fetch()
+    clock[0] += 6
+    fetch()
+    assert calls == [100.0, 111.0]
+
+
+def test_only_network_requests_take_rate_limit_tokens(fake_api):
+    for _ in range(5):
+        sirocco_api.get_forecasts_info(7)
+
+    assert len(fake_api.sent) == 1
+    assert fake_api.bucket.taken == 1
+
+
+def test_token_bucket_allows_burst_then_paces(monkeypatch):
+    clock = [0.0]
+    sleeps = []
+    monkeypatch.setattr(sirocco_api.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(sirocco_api.time, "sleep", sleeps.append)
+
+    bucket = sirocco_api._TokenBucket(rate_per_sec=10, capacity=3)
+    for _ in range(5):
+        bucket.acquire()
+
+    # The first three requests use the burst, the next two wait 0.1s and 0.2s.
+    assert sleeps == [pytest.approx(0.1), pytest.approx(0.2)]
+
+    clock[0] += 1.0
+    sleeps.clear()
+    bucket.acquire()
+    assert sleeps == []
+
+
+def test_endpoint_builds_params_and_skips_unset_arguments(fake_api):
+    result = sirocco_api.get_selected_backtests(
+        21, init_date="2024-03-01", init_ahead="1440", end_ahead=2880
+    )
+
+    assert result["path"] == "/national/selectedbacktests/v1.1/"
+    assert result["params"] == {
+        "run": "21",
+        "init": "2024-03-01",
+        "init_ahead": "1440",
+        "end_ahead": "2880",
+        "timezone": "UTC",
+    }
+
+
+def test_endpoint_maps_argument_names_to_query_names(fake_api):
+    result = sirocco_api.get_real_data(10, "2024-03-01", "2024-03-02 00:00:00")
+
+    assert result["path"] == "/national/realdata/v1.1/"
+    assert result["params"] == {
+        "run": "10",
+        "init": "2024-03-01",
+        "end": "2024-03-02 00:00:00",
+        "timezone": "UTC",
+    }
+
+
+def test_endpoint_sends_explicit_falsy_values(fake_api):
+    result = sirocco_api.get_selected_backtests(21, init_ahead=0, end_ahead=60)
+
+    assert result["params"]["init_ahead"] == "0"
+
+
+@pytest.mark.parametrize(
+    "call, message",
+    [
+        (lambda: sirocco_api.get_backtests_info("x"), "run must be an integer"),
+        (
+            lambda: sirocco_api.get_selected_forecast(1, init_date="2024/03/01"),
+            "init_date must be in the format",
+        ),
+        (
+            lambda: sirocco_api.get_selected_backtests(1, init_ahead=-1),
+            "init_ahead must be a positive integer",
+        ),
+        (
+            lambda: sirocco_api.get_selected_backtests(1, init_ahead=60, end_ahead=30),
+            "end_ahead must be greater than init_ahead",
+        ),
+    ],
+)
+def test_endpoint_validation_happens_before_the_request(fake_api, call, message):
+    with pytest.raises(ValueError, match=message):
+        call()
+    assert fake_api.sent == []
+
+
+def test_endpoint_raises_api_error_on_bad_status(fake_api):
+    fake_api.statuses.append(404)
+
+    with pytest.raises(sirocco_api.SiroccoAPIError) as excinfo:
+        sirocco_api.get_forecasts_info(99)
+    assert excinfo.value.status == 404
+
+
+def test_endpoint_signature_reports_dict_return():
+    signature = inspect.signature(sirocco_api.get_selected_forecast)
+
+    assert signature.return_annotation is sirocco_api.Dict
+    assert list(signature.parameters) == ["run", "timezone", "init_date", "end_date"]
+
+
+@pytest.fixture
+def retrying_session(monkeypatch, local_server):
+    """The module's real session (urllib3 Retry included) pointed at `local_server`.
+
+    Backoff is disabled so the retry schedule doesn't slow the tests down.
+    """
+    monkeypatch.setattr(
+        sirocco_api,
+        "_RETRY",
+        sirocco_api._RETRY.new(backoff_factor=0, backoff_jitter=0),
+    )
+    session = sirocco_api._build_session(backend="memory")
+    session.mount("http://", session.get_adapter("https://"))
+    monkeypatch.setattr(sirocco_api, "_SESSION", session)
+    monkeypatch.setattr(sirocco_api, "_BUCKET", sirocco_api._TokenBucket(1000, 1000))
+    return local_server
+
+
+def test_retry_has_jitter():
+    assert sirocco_api._RETRY.backoff_jitter > 0
+
+
+def test_sync_path_retries_transient_errors(retrying_session):
+    url, statuses, seen = retrying_session
+    statuses.extend([503, 503])
+
+    response = sirocco_api._get(url)
+
+    assert response.status_code == 200
+    assert len(seen) == 3
+
+
+def test_sync_path_raises_last_status_when_retries_run_out(retrying_session):
+    url, statuses, seen = retrying_session
+    statuses.extend([503] * sirocco_api._RETRY.total + [429])
+
+    response = sirocco_api._get(url)
+    with pytest.raises(sirocco_api.SiroccoAPIError) as excinfo:
+        sirocco_api._raise_for_status(response)
+
+    assert excinfo.value.status == 429
+    assert len(seen) == sirocco_api._RETRY.total + 1
+
+
+def test_endpoint_accepts_datetime_arguments(fake_api):
+    result = sirocco_api.get_selected_forecast(
+        10, init_date=datetime(2024, 3, 1, 6, 30), end_date="2024-03-02"
+    )
+
+    assert result["params"]["init"] == "2024-03-01 06:30:00"
+    assert result["params"]["end"] == "2024-03-02"
+
+
+def test_endpoint_accepts_pandas_timestamps(fake_api):
+    pd = pytest.importorskip("pandas")
+
+    result = sirocco_api.get_real_data(10, end_date=pd.Timestamp("2024-03-02"))
+
+    assert result["params"]["end"] == "2024-03-02 00:00:00"
+
+
+def test_validate_dt_rejects_other_types():
+    with pytest.raises(ValueError, match="init_date must be in the format"):
+        sirocco_api._validate_dt(20240301, "init_date")
+
+
+def test_ttl_cache_lets_unhashable_arguments_reach_validation(fake_api):
+    with pytest.raises(ValueError, match="return_id_project must be a boolean"):
+        sirocco_api.get_my_projects([])
+    assert fake_api.sent == []
+
+
+def test_set_rate_limit_rebuilds_the_bucket(monkeypatch):
+    monkeypatch.setattr(sirocco_api, "RATE_LIMIT_PER_MINUTE", 120)
+    monkeypatch.setattr(sirocco_api, "_BUCKET", sirocco_api._BUCKET)
+
+    sirocco_api.set_rate_limit(60)
+
+    assert sirocco_api.RATE_LIMIT_PER_MINUTE == 60
+    assert sirocco_api._BUCKET.rate == 1
+    assert sirocco_api._BUCKET.capacity == 10
+
+
+@pytest.mark.parametrize("per_minute", [0, -5, 1.5, "60"])
+def test_set_rate_limit_rejects_invalid_values(per_minute):
+    with pytest.raises(ValueError, match="per_minute must be a positive integer"):
+        sirocco_api.set_rate_limit(per_minute)